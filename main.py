@@ -1,7 +1,6 @@
 import pygame
-import random
-from dataclasses import dataclass
-from typing import List, Generator, Tuple
+import numpy as np
+from typing import List, Set, Tuple
 
 # --- Configuration Constants ---
 CELL_SIZE = 30
@@ -10,6 +9,13 @@ ROWS = 15
 MINES_COUNT = 30
 WIDTH, HEIGHT = COLS * CELL_SIZE, ROWS * CELL_SIZE
 
+# (row, col) offsets of the 8 neighbors surrounding a cell
+NEIGHBOR_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+)
+
 # Color palette definition for easy theme adjustments
 COLORS = {
     'bg': (192, 192, 192),
@@ -22,25 +28,90 @@ COLORS = {
 }
 
 
-@dataclass
-class Cell:
+def flood_fill(is_open: np.ndarray, is_flagged: np.ndarray, adjacent_mines: np.ndarray,
+               r: int, c: int) -> List[Tuple[int, int]]:
     """
-    Represents the state of a single cell on the game board.
-    Attributes:
-        is_mine (bool): True if the cell contains a mine.
-        is_open (bool): True if the cell has been revealed by the player.
-        is_flagged (bool): True if the player has placed a flag on this cell.
-        adjacent_mines (int): The number of mines in the 8 neighboring cells.
+    Opens the empty region around (r, c) with a scanline Flood Fill:
+    whole horizontal runs of empty cells are opened at once, and the rows
+    above and below are seeded only once per run instead of once per cell.
+    The scan runs on plain nested lists copied from the board arrays, since
+    reading single NumPy elements is far slower than indexing a list; the
+    opened cells are written back to the array in one step at the end.
+    Args:
+        is_open (np.ndarray): Open state of every cell, updated in place.
+        is_flagged (np.ndarray): Flag state of every cell.
+        adjacent_mines (np.ndarray): Adjacent mine count of every cell.
+        r (int): Row index of an empty (zero-count), closed cell.
+        c (int): Column index of that cell.
+
+    Returns:
+        List[Tuple[int, int]]: Coordinates (row, col) of every newly opened cell.
     """
-    is_mine: bool = False
-    is_open: bool = False
-    is_flagged: bool = False
-    adjacent_mines: int = 0
+    # Every cell touched here borders an empty cell, so none of them is a mine
+    open_rows = is_open.tolist()
+    flag_rows = is_flagged.tolist()
+    adj_rows = adjacent_mines.tolist()
+    rows, cols = is_open.shape
+    last_col = cols - 1
+    opened = []
+    stack = [(r, c)]
+
+    while stack:
+        r, c = stack.pop()
+        open_row, flag_row, adj_row = open_rows[r], flag_rows[r], adj_rows[r]
+
+        # The seed may already have been swallowed by another run
+        if open_row[c]:
+            continue
+
+        # Extend the run of closed empty cells to the left and right
+        left = c
+        while left > 0 and not open_row[left - 1] and not flag_row[left - 1] and adj_row[left - 1] == 0:
+            left -= 1
+        right = c
+        while right < last_col and not open_row[right + 1] and not flag_row[right + 1] and adj_row[right + 1] == 0:
+            right += 1
+
+        # Open the run together with the numbered cells that bound it
+        lo, hi = max(left - 1, 0), min(right + 1, last_col)
+        for cc in range(lo, hi + 1):
+            if not open_row[cc] and not flag_row[cc]:
+                open_row[cc] = 1
+                opened.append((r, cc))
+
+        # Scan the rows above and below the run (including diagonals):
+        # numbered cells are opened directly, and each contiguous stretch
+        # of empty cells gets a single seed for a later run
+        for nr in (r - 1, r + 1):
+            if not 0 <= nr < rows:
+                continue
+            open_row, flag_row, adj_row = open_rows[nr], flag_rows[nr], adj_rows[nr]
+            seeded = False
+            for cc in range(lo, hi + 1):
+                if open_row[cc] or flag_row[cc]:
+                    seeded = False
+                elif adj_row[cc] == 0:
+                    if not seeded:
+                        stack.append((nr, cc))
+                        seeded = True
+                else:
+                    open_row[cc] = 1
+                    opened.append((nr, cc))
+                    seeded = False
+
+    # Write every opened cell back to the board in a single vectorized assignment
+    if opened:
+        opened_r, opened_c = zip(*opened)
+        is_open[opened_r, opened_c] = 1
+
+    return opened
 
 
 class GameBoard:
     """
     Manages the core game logic, board state, and rule enforcement.
+    The board is stored as parallel (rows, cols) uint8 arrays, one per cell field,
+    so whole-board operations run as vectorized NumPy expressions.
     """
 
     def __init__(self, cols: int, rows: int, mines: int):
@@ -57,68 +128,77 @@ class GameBoard:
         self.mines = mines
         self.game_over = False
         self.won = False
-        self.board: List[List[Cell]] = []
+        # Number of safe cells that are still closed; the game is won at zero
+        self.safe_remaining = cols * rows - mines
+        self.is_mine = np.zeros((rows, cols), dtype=np.uint8)
+        self.is_open = np.zeros((rows, cols), dtype=np.uint8)
+        self.is_flagged = np.zeros((rows, cols), dtype=np.uint8)
+        self.adjacent_mines = np.zeros((rows, cols), dtype=np.uint8)
+        self._rng = np.random.default_rng()
+        # Mines are placed on the first reveal, so the first click is always safe
+        self._mines_placed = False
+        # Cells whose visual state changed since the last frame was drawn
+        self.dirty: Set[Tuple[int, int]] = set()
 
         # Initialize the game state immediately upon creation
         self.reset_game()
 
     def reset_game(self):
         """
-        Resets the game to its initial state: clears the board,
-        places new mines, and recalculates adjacencies.
+        Resets the game to its initial state: clears the board.
+        New mines are placed around the player's first reveal.
         """
         self.game_over = False
         self.won = False
-        # Create a 2D grid of fresh Cell objects using list comprehension
-        self.board = [[Cell() for _ in range(self.cols)] for _ in range(self.rows)]
-        self._place_mines()
-        self._calculate_adjacent_mines()
-
-    def _get_neighbors(self, r: int, c: int) -> Generator[Tuple[int, int], None, None]:
+        # Clear every per-cell field in place
+        self.is_mine.fill(0)
+        self.is_open.fill(0)
+        self.is_flagged.fill(0)
+        self.adjacent_mines.fill(0)
+        self.safe_remaining = self.cols * self.rows - self.mines
+        # Every cell has to be repainted after a reset
+        self.dirty = {(r, c) for r in range(self.rows) for c in range(self.cols)}
+        self._mines_placed = False
+
+    def _place_mines(self, safe_r: int, safe_c: int):
         """
-        A generator that yields valid coordinates for neighbors of a specific cell.
-        This helper method handles boundary checks to prevent IndexError.
+        Randomly distributes mines across the board, keeping the given cell and
+        its neighbors free so the first reveal always opens an empty area.
+        On boards too crowded for that, only the given cell itself is kept free.
         Args:
-            r (int): Row index.
-            c (int): Column index.
-
-        Yields:
-            Tuple[int, int]: Coordinates (row, col) of a valid neighbor.
+            safe_r (int): Row index of the first revealed cell.
+            safe_c (int): Column index of the first revealed cell.
         """
-        # Iterate through 3x3 grid around the cell
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue  # Skip the cell itself
-
-                nr, nc = r + dr, c + dc
+        allowed = np.ones((self.rows, self.cols), dtype=bool)
+        allowed[max(safe_r - 1, 0):safe_r + 2, max(safe_c - 1, 0):safe_c + 2] = False
+        if np.count_nonzero(allowed) < self.mines:
+            # Only a completely mined board cannot spare the clicked cell
+            allowed[:] = True
+            allowed[safe_r, safe_c] = self.mines >= self.rows * self.cols
 
-                # Check bounds to ensure the neighbor is within the grid
-                if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                    yield nr, nc
+        # Select unique flat cell indices for mines among the allowed cells
+        indices = self._rng.choice(np.flatnonzero(allowed), size=self.mines, replace=False)
 
-    def _place_mines(self):
-        """Randomly distributes mines across the board."""
-        # Generate a list of all possible coordinates
-        all_coords = [(r, c) for r in range(self.rows) for c in range(self.cols)]
-
-        # Select unique coordinates for mines
-        for r, c in random.sample(all_coords, self.mines):
-            self.board[r][c].is_mine = True
+        # Scatter them into the grid in one vectorized assignment
+        self.is_mine.flat[indices] = 1
 
     def _calculate_adjacent_mines(self):
         """
         Pre-calculates the 'adjacent_mines' count for every cell on the board.
         This optimization avoids recalculating neighbors during the game loop.
+        The mine grid is zero-padded by one cell and each of the 8 shifted
+        windows is added at once, so the whole pass runs inside NumPy.
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if not self.board[r][c].is_mine:
-                    # Sum up the number of neighbors that contain mines
-                    self.board[r][c].adjacent_mines = sum(
-                        1 for nr, nc in self._get_neighbors(r, c)
-                        if self.board[nr][nc].is_mine
-                    )
+        padded = np.pad(self.is_mine, 1)
+        adjacent = np.zeros_like(self.is_mine)
+
+        # Add the window shifted towards each neighbor; padding handles the edges
+        for dr, dc in NEIGHBOR_OFFSETS:
+            adjacent += padded[1 + dr:1 + dr + self.rows, 1 + dc:1 + dc + self.cols]
+
+        # Mines do not display a count
+        adjacent[self.is_mine == 1] = 0
+        self.adjacent_mines[:] = adjacent
 
     def handle_click(self, r: int, c: int, button: int):
         """
@@ -142,43 +222,53 @@ class GameBoard:
 
     def open_cell(self, r: int, c: int):
         """
-        Reveals a cell. Implements the Flood Fill algorithm for empty areas.
+        Reveals a cell. Empty areas are opened with the flood_fill kernel.
         Args:
             r (int): Row index.
             c (int): Column index.
         """
-        cell = self.board[r][c]
+        is_open, is_flagged = self.is_open, self.is_flagged
 
         # Base case: Do nothing if cell is already processed or protected by a flag
-        if cell.is_open or cell.is_flagged:
+        if is_open[r, c] or is_flagged[r, c]:
             return
 
-        cell.is_open = True
+        if not self._mines_placed:
+            self._place_mines(r, c)
+            self._calculate_adjacent_mines()
+            self._mines_placed = True
 
-        if cell.is_mine:
+        if self.is_mine[r, c]:
+            is_open[r, c] = 1
+            self.dirty.add((r, c))
             self.game_over = True
             return
 
-        # Recursive step: If the cell has no adjacent mines, automatically open neighbors
-        if cell.adjacent_mines == 0:
-            for nr, nc in self._get_neighbors(r, c):
-                self.open_cell(nr, nc)
+        if self.adjacent_mines[r, c] > 0:
+            is_open[r, c] = 1
+            self.dirty.add((r, c))
+            self.safe_remaining -= 1
+            return
+
+        # Open the whole empty region and record what changed
+        opened = flood_fill(is_open, is_flagged, self.adjacent_mines, r, c)
+        self.dirty.update(opened)
+        self.safe_remaining -= len(opened)
 
     def toggle_flag(self, r: int, c: int):
         """Toggles the flag state, but only for closed cells."""
-        if not self.board[r][c].is_open:
-            self.board[r][c].is_flagged = not self.board[r][c].is_flagged
+        if not self.is_open[r, c]:
+            self.is_flagged[r, c] ^= 1
+            self.dirty.add((r, c))
 
     def _check_win(self):
         """
         Checks victory condition: The game is won if all non-mine cells are open.
+        open_cell keeps count of the closed safe cells, so this is a constant-time check.
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.board[r][c]
-                # If there is a safe cell that is still closed, the game continues
-                if not cell.is_mine and not cell.is_open:
-                    return
+        # If there is a safe cell that is still closed, the game continues
+        if self.safe_remaining > 0:
+            return
 
         self.won = True
         self.game_over = True
@@ -189,23 +279,111 @@ def main():
     Main entry point. Initializes Pygame, handles the event loop, and rendering.
     """
     pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    # SCALED routes presentation through SDL's GPU renderer. Requesting vsync
+    # raises pygame.error where the renderer cannot provide it, so fall back
+    # to presenting without vsync instead of failing to start.
+    try:
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    except pygame.error:
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=0)
     pygame.display.set_caption("Minesweeper (Press R to Reset)")
 
+    # The grid layout never changes, so pre-render the background and all
+    # cell borders once instead of redrawing them every frame
+    bg_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    bg_surface.fill(COLORS['bg'])
+
+    # Every cell is outlined on all four sides, so each column and row is
+    # bounded by a pair of full-length lines instead of one rect per cell
+    for c in range(COLS):
+        for x in (c * CELL_SIZE, (c + 1) * CELL_SIZE - 1):
+            pygame.draw.line(bg_surface, COLORS['grid'], (x, 0), (x, HEIGHT - 1))
+    for r in range(ROWS):
+        for y in (r * CELL_SIZE, (r + 1) * CELL_SIZE - 1):
+            pygame.draw.line(bg_surface, COLORS['grid'], (0, y), (WIDTH - 1, y))
+
+    # Flags and mines look the same in every cell, so draw each shape once
+    # onto a transparent cell-sized sprite and blit it where needed
+    flag_sprite = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+    pygame.draw.polygon(flag_sprite, COLORS['flag'], [
+        (5, 5),
+        (CELL_SIZE - 5, CELL_SIZE // 2),
+        (5, CELL_SIZE - 5)
+    ])
+    flag_sprite = flag_sprite.convert_alpha()
+
+    mine_sprite = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(mine_sprite, COLORS['mine'], (CELL_SIZE // 2, CELL_SIZE // 2), CELL_SIZE // 3)
+    mine_sprite = mine_sprite.convert_alpha()
+
     # Fonts initialization
     font_numbers = pygame.font.SysFont('Arial', CELL_SIZE // 2)
     font_game_over = pygame.font.SysFont('Arial', 40)
 
+    # Font rasterization is slow, so every text surface is rendered once here.
+    # Digits are stored together with the offset that centers them in a cell.
+    number_surfs = {}
+    number_offsets = {}
+    for n in range(1, 9):
+        surf = font_numbers.render(str(n), True, COLORS['text']).convert_alpha()
+        number_surfs[n] = surf
+        number_offsets[n] = surf.get_rect(center=(CELL_SIZE // 2, CELL_SIZE // 2)).topleft
+
+    restart_text = font_numbers.render("Press R or Click to Restart", True, COLORS['white']).convert_alpha()
+    restart_pos = restart_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50))
+
+    # Semi-transparent overlay shared by both end-of-game screens
+    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    overlay.fill(COLORS['overlay'])
+    overlay = overlay.convert_alpha()
+
+    # Each end-of-game screen is the overlay, its status message and the restart
+    # hint, blitted straight onto the screen in this order. The text is not baked
+    # into the translucent overlay, as blending onto it would darken the edges.
+    game_over_blits = {}
+    for won, msg, color in ((True, "VICTORY!", (0, 255, 0)), (False, "GAME OVER", (255, 0, 0))):
+        text = font_game_over.render(msg, True, color).convert_alpha()
+        game_over_blits[won] = [
+            (overlay, (0, 0)),
+            (text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2))),
+            (restart_text, restart_pos)
+        ]
+
+    # Screen rectangle of every cell, built once so the render loop never creates one
+    cell_rects = [
+        [pygame.Rect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE) for c in range(COLS)]
+        for r in range(ROWS)
+    ]
+
     game = GameBoard(COLS, ROWS, MINES_COUNT)
     clock = pygame.time.Clock()
 
+    # Bind names used for every dirty cell to locals to skip repeated lookups.
+    # The board arrays are cleared in place on reset, so these stay valid.
+    is_open, is_mine, is_flagged = game.is_open, game.is_mine, game.is_flagged
+    adjacent_mines = game.adjacent_mines
+    screen_blits = screen.blits
+
+    overlay_shown = False
     running = True
     while running:
         # --- Event Handling ---
-        for event in pygame.event.get():
+        if game.dirty:
+            events = pygame.event.get()
+        else:
+            # Nothing to redraw: sleep until input arrives instead of polling
+            events = [pygame.event.wait(50)]
+            events.extend(pygame.event.get())
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            # Only changed areas are pushed each frame, so re-present the
+            # whole screen when the window needs repainting
+            if event.type == pygame.WINDOWEXPOSED:
+                pygame.display.flip()
+
             # Keyboard shortcuts
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
@@ -218,52 +396,48 @@ def main():
                 game.handle_click(my // CELL_SIZE, mx // CELL_SIZE, event.button)
 
         # --- Rendering ---
-        screen.fill(COLORS['bg'])
+        # Idle frames where nothing changed on screen skip the pass entirely
+        if game.dirty or game.game_over != overlay_shown:
+            # Only cells that changed since the last frame are repainted: the cached
+            # background tile is restored first, then the cell contents go on top.
+            # All blits are collected and submitted to pygame in a single call.
+            dirty_rects = []
+            blit_seq = []
+            add_blit = blit_seq.append
+            for r, c in game.dirty:
+                rect = cell_rects[r][c]
+                add_blit((bg_surface, rect, rect))
+
+                if is_open[r, c]:
+                    if is_mine[r, c]:
+                        # Draw mine (Red Circle)
+                        add_blit((mine_sprite, rect.topleft))
+                    else:
+                        count = int(adjacent_mines[r, c])
+                        if count > 0:
+                            # Draw neighbor count number
+                            ox, oy = number_offsets[count]
+                            add_blit((number_surfs[count], (rect.x + ox, rect.y + oy)))
+                elif is_flagged[r, c]:
+                    # Draw flag (Yellow Triangle)
+                    add_blit((flag_sprite, rect.topleft))
 
-        for r in range(ROWS):
-            for c in range(COLS):
-                cell = game.board[r][c]
-                rect = pygame.Rect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                dirty_rects.append(rect)
+            screen_blits(blit_seq, doreturn=False)
+            game.dirty.clear()
 
-                # Draw cell border
-                pygame.draw.rect(screen, COLORS['grid'], rect, 1)
+            # --- Game Over / Victory Overlay ---
+            # The overlay is translucent, so it is drawn exactly once per finished
+            # game; a reset repaints every cell and wipes it out again
+            if game.game_over and not overlay_shown:
+                screen_blits(game_over_blits[game.won], doreturn=False)
+                dirty_rects.append(screen.get_rect())
+            overlay_shown = game.game_over
 
-                if cell.is_open:
-                    if cell.is_mine:
-                        # Draw mine (Red Circle)
-                        pygame.draw.circle(screen, COLORS['mine'], rect.center, CELL_SIZE // 3)
-                    elif cell.adjacent_mines > 0:
-                        # Draw neighbor count number
-                        text = font_numbers.render(str(cell.adjacent_mines), True, COLORS['text'])
-                        screen.blit(text, text.get_rect(center=rect.center))
-                elif cell.is_flagged:
-                    # Draw flag (Yellow Triangle)
-                    pygame.draw.polygon(screen, COLORS['flag'], [
-                        (rect.left + 5, rect.top + 5),
-                        (rect.right - 5, rect.centery),
-                        (rect.left + 5, rect.bottom - 5)
-                    ])
-
-        # --- Game Over / Victory Overlay ---
-        if game.game_over:
-            # Create a semi-transparent overlay
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill(COLORS['overlay'])
-            screen.blit(overlay, (0, 0))
-
-            # Prepare status message
-            msg = "VICTORY!" if game.won else "GAME OVER"
-            color = (0, 255, 0) if game.won else (255, 0, 0)
-
-            # Render text centered on screen
-            text = font_game_over.render(msg, True, color)
-            screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
-
-            restart_text = font_numbers.render("Press R or Click to Restart", True, COLORS['white'])
-            screen.blit(restart_text, restart_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50)))
-
-        # Update display and cap the frame rate
-        pygame.display.flip()
+            # Push only the changed areas to the display
+            pygame.display.update(dirty_rects)
+
+        # Cap the frame rate
         clock.tick(60)
 
     pygame.quit()